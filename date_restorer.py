@@ -11,10 +11,10 @@ The script works regardless of its filename - you can rename it to anything.py
 and it will still function correctly, adapting all examples and help text.
 
 How to add new filename patterns:
-1. Find the 'extract_date' function in the code
-2. Add a new pattern section following the existing examples
-3. Use regex to extract date components from the filename
-4. Return a datetime object and an explanation string
+1. Add a named branch to the _DATE_RE alternation near the top of the file
+2. Write a _handle_<branch> function following the existing examples
+3. Register the handler in the _HANDLERS dispatch table
+4. Return a datetime object and an explanation string (or None on failure)
 
 License: MIT
 """
@@ -24,24 +24,275 @@ import re
 import time
 import sys
 import argparse
+import array
+import concurrent.futures
+import functools
 import logging
+import unicodedata
 from datetime import datetime
 
+# All independent filename patterns fused into a single alternation compiled
+# once at import time, so one scan classifies the filename instead of nine
+# sequential re.search calls. Each alternative is a named branch; extract_date
+# collects the leftmost match of every branch present (match.lastgroup names
+# the branch), rescanning past each match's start so overlapping branches
+# are not lost, and then dispatches in _HANDLERS declaration order, which
+# mirrors the original pattern precedence - so a higher-priority pattern
+# found later in the name still wins, and a rejected branch falls through
+# to the next one, like the old sequential searches. Branches matching at
+# the same position are shadowed by alternation order, which only affects
+# the 2A/2B pair; the collection loop records a 2A match under both names.
+_DATE_RE = re.compile(
+    # Pattern 1: 20181128_110755.jpg or IMG_20180507_192217158.jpg
+    r'(?P<p1>(?P<p1_date>\d{8})_(?P<p1_time>\d{6}))'
+    # Pattern 2A: 2020-01-01 12.30.59.jpg (date and time separated)
+    r'|(?P<p2a>\d{4}-\d{2}-\d{2} \d{2}\.\d{2}\.\d{2})'
+    # Pattern 2B: WhatsApp Image 2018-11-27 at 18.41.02.png
+    r'|(?P<p2b>\d{4}-\d{2}-\d{2})'
+    # Pattern 3: FB_IMG_1545742864733.jpg (prefixed Unix timestamp)
+    r'|(?P<ts>(?:FB_IMG_|IMG_)(?P<ts_digits>\d{9,13})(?=\.|_|$))'
+    # Pattern 4: Screenshot_20200101-151016_Calendar.jpg
+    r'|(?P<screenshot>Screenshot_(?P<ss_date>\d{8})-(?P<ss_time>\d{6}))'
+    # Pattern 5: VID-20200615-WA0127.mp4
+    r'|(?P<vid>VID-(?P<vid_date>\d{8})-WA)'
+    # Pattern 6: IMG-20181225-WA0014.jpg
+    r'|(?P<img>IMG-(?P<img_date>\d{8})-WA)'
+    # Pattern 7: Photo_20200101_123059.jpg (common on Android phones)
+    r'|(?P<photo>Photo_(?P<photo_date>\d{8})_(?P<photo_time>\d{6}))'
+    # Pattern 9: JPEG_20200722_183656.jpg (common on smartphones)
+    r'|(?P<jpeg>JPEG_(?P<jpeg_date>\d{8})_(?P<jpeg_time>\d{6}))'
+    # Pattern 10: VideoCapture_20240513-155722.jpg
+    r'|(?P<vidcap>VideoCapture_(?P<vc_date>\d{8})-(?P<vc_time>\d{6}))'
+    # Pattern 11: 1628085150288-52bceeb9-f9d1-45ec-bcef-c8e594921.jpg (Timestamp-UUID.jpg)
+    r'|(?P<tsuuid>^(?P<tsuuid_digits>\d{13})-[\w-]+(?i:\.(?:jpg|jpeg|png|mp4|mov|gif|bmp|tif|tiff|webm|avi|mkv))$)'
+    # Pattern 12: Picsart_22-09-05_08-32-31-010.jpg
+    r'|(?P<picsart>Picsart_(?P<pa_y>\d{2})-(?P<pa_mo>\d{2})-(?P<pa_d>\d{2})_(?P<pa_h>\d{2})-(?P<pa_mi>\d{2})-(?P<pa_s>\d{2}))'
+    # Pattern 13: CamScanner 10-30-2022 17.02.jpg or CamScanner 10-30-2022 17.02_1.jpg
+    r'|(?P<camscanner>(?i:CamScanner) (?P<cs_mo>\d{2})-(?P<cs_d>\d{2})-(?P<cs_y>\d{4}) (?P<cs_h>\d{2})\.(?P<cs_mi>\d{2})(?:_\d+)?(?i:\.(?:jpg|jpeg|png|pdf))$)'
+)
+
+# Fast-reject gate: every pattern above requires at least one of these
+# anchors (an 8+ digit run, a dashed date, or one of the app literals whose
+# patterns only contain short digit runs). One cheap scan rejects the common
+# "no match" filename before the full alternation is attempted.
+# Note: a bare \d{8} gate is NOT enough - the dashed YYYY-MM-DD dates and
+# the Picsart/CamScanner names never contain 8 consecutive digits.
+_PREFILTER_RE = re.compile(r'\d{8}|\d{4}-\d{2}-\d{2}|Picsart_|(?i:CamScanner) ')
+
+# Shortest filename any pattern can match: a bare dashed date, YYYY-MM-DD
+# (10 chars). Anything shorter is rejected on length alone.
+_MIN_LEN = 10
+
+# Secondary scan for Pattern 2B's optional "at HH.MM.SS" time suffix
+_AT_TIME_RE = re.compile(r'at (\d{2})\.(\d{2})\.(\d{2})')
+
+# Pattern 3 (standalone): media extensions accepted when the entire
+# filename is just a timestamp, e.g. 1577836800.jpg (checked with plain
+# string operations in extract_date; no regex needed for this shape)
+_STANDALONE_TS_EXTS = frozenset(
+    '.jpg .jpeg .png .mp4 .mov .gif .bmp .tif .tiff .webm .avi .mkv'.split()
+)
+
+# Beginning of Unix time, used to validate extracted timestamps
+_UNIX_EPOCH = datetime(1970, 1, 1)
+
+# Root logger, cached so hot loops can check isEnabledFor without a
+# getLogger call per file
+_log = logging.getLogger()
+
+# Per-run snapshot of "now" for timestamp validation. None means query the
+# clock on demand; process_folder_recursively takes one snapshot per batch
+# so large runs don't pay a gettimeofday per file. _NOW_TS is the same
+# instant as a Unix timestamp, used for the cheap integer pre-check.
+_NOW = None
+_NOW_TS = None
+
+# Translation table for normalize_digits, generated once at import time by
+# scanning the Basic Multilingual Plane. Maps every non-ASCII Unicode
+# decimal digit (Arabic-Indic, Persian, Devanagari, Bengali, ...) to its
+# ASCII counterpart.
+_DIGIT_TABLE = {
+    code: ord('0') + unicodedata.decimal(chr(code))
+    for code in range(0x10000)
+    if chr(code).isdecimal() and not chr(code).isascii()
+}
+
 def normalize_digits(s):
     """
     Convert unicode digits (Arabic, Persian, etc.) to Western digits (0-9).
-    
+
+    Pure-ASCII strings (the common case) are returned as-is without
+    translation; str.isascii() is a constant-time check on CPython.
+
     Args:
         s (str): String containing possible unicode digits
-        
+
     Returns:
         str: String with digits converted to Western format
     """
-    return s.translate(str.maketrans(
-        '٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹',
-        '01234567890123456789'
-    ))
+    if s.isascii():
+        return s
+    return s.translate(_DIGIT_TABLE)
+
+def _parse_ymd_hms(date_str, time_str='000000'):
+    """
+    Build a datetime from fixed-width YYYYMMDD and HHMMSS digit strings.
 
+    This is the pure string-slicing + integer kernel shared by the regex
+    handlers; it raises ValueError for impossible dates just like the
+    datetime constructor.
+
+    Args:
+        date_str (str): Eight digits, YYYYMMDD
+        time_str (str): Six digits, HHMMSS (defaults to midnight)
+
+    Returns:
+        datetime: The corresponding datetime object
+    """
+    return datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]),
+                    int(time_str[:2]), int(time_str[2:4]), int(time_str[4:6]))
+
+def _handle_p1(m, filename):
+    """Pattern 1: 20181128_110755.jpg or IMG_20180507_192217158.jpg"""
+    try:
+        d, t = m.group('p1_date'), m.group('p1_time')
+        return _parse_ymd_hms(d, t), f"{d} {t}"
+    except ValueError:
+        return None
+
+def _date_with_at_time(date_part, filename):
+    """Build Pattern 2B's result: YYYYMMDD digits plus an optional 'at HH.MM.SS'."""
+    # The time-suffix scan can only succeed if the literal is there
+    m2 = _AT_TIME_RE.search(filename) if 'at ' in filename else None
+    if m2:
+        time_part = f"{m2.group(1)}{m2.group(2)}{m2.group(3)}"
+    else:
+        time_part = "000000"
+    return _parse_ymd_hms(date_part, time_part), f"{date_part} {time_part}"
+
+def _handle_p2a(m, filename):
+    """Pattern 2A: 2020-01-01 12.30.59.jpg (format with date and time separated)"""
+    try:
+        text = m.group('p2a')
+        date_part = text[:10].replace('-', '')
+        time_part = text[11:].replace('.', '')
+        return _parse_ymd_hms(date_part, time_part), f"{date_part} {time_part}"
+    except ValueError:
+        return None
+
+def _handle_p2b(m, filename):
+    """Pattern 2B: WhatsApp Image 2018-11-27 at 18.41.02.png
+
+    The match may come from the 2A branch: 2B is a prefix of 2A, so a
+    2A match doubles as the 2B candidate at the same position, and the
+    first 10 characters are the date either way.
+    """
+    try:
+        return _date_with_at_time(m.group(0)[:10].replace('-', ''), filename)
+    except ValueError:
+        return None
+
+def _handle_ts(m, filename):
+    """Pattern 3: FB_IMG_1545742864733.jpg (prefixed Unix timestamp)"""
+    dt, info = _timestamp_to_date(m.group('ts_digits'))
+    if dt:
+        return dt, info
+    return None
+
+def _handle_screenshot(m, filename):
+    """Pattern 4: Screenshot_20200101-151016_Calendar.jpg or Screenshot_20200224-162219.jpg"""
+    try:
+        d, t = m.group('ss_date'), m.group('ss_time')
+        return _parse_ymd_hms(d, t), f"{d} {t}"
+    except ValueError:
+        return None
+
+def _handle_vid(m, filename):
+    """Pattern 5: VID-20200615-WA0127.mp4"""
+    try:
+        d = m.group('vid_date')
+        return _parse_ymd_hms(d), f"{d} 000000"
+    except ValueError:
+        return None
+
+def _handle_img(m, filename):
+    """Pattern 6: IMG-20181225-WA0014.jpg or IMG-20181218-WA0002.jpeg"""
+    try:
+        d = m.group('img_date')
+        return _parse_ymd_hms(d), f"{d} 000000"
+    except ValueError:
+        return None
+
+def _handle_photo(m, filename):
+    """Pattern 7: Photo_20200101_123059.jpg (common on Android phones)"""
+    try:
+        d, t = m.group('photo_date'), m.group('photo_time')
+        return _parse_ymd_hms(d, t), f"{d} {t}"
+    except ValueError:
+        return None
+
+def _handle_jpeg(m, filename):
+    """Pattern 9: JPEG_20200722_183656.jpg (common on smartphones)"""
+    try:
+        d, t = m.group('jpeg_date'), m.group('jpeg_time')
+        return _parse_ymd_hms(d, t), f"{d} {t}"
+    except ValueError:
+        return None
+
+def _handle_vidcap(m, filename):
+    """Pattern 10: VideoCapture_20240513-155722.jpg"""
+    try:
+        d, t = m.group('vc_date'), m.group('vc_time')
+        return _parse_ymd_hms(d, t), f"VideoCapture {d} {t}"
+    except ValueError:
+        return None
+
+def _handle_tsuuid(m, filename):
+    """Pattern 11: 1628085150288-52bceeb9-f9d1-45ec-bcef-c8e594921.jpg (Timestamp-UUID.jpg)"""
+    dt, info = _timestamp_to_date(m.group('tsuuid_digits'))
+    if dt:
+        return dt, info
+    return None
+
+def _handle_picsart(m, filename):
+    """Pattern 12: Picsart_22-09-05_08-32-31-010.jpg"""
+    try:
+        # Assuming YY is 20YY
+        date_str = f"20{m.group('pa_y')}{m.group('pa_mo')}{m.group('pa_d')}"
+        time_str = f"{m.group('pa_h')}{m.group('pa_mi')}{m.group('pa_s')}"
+        return _parse_ymd_hms(date_str, time_str), f"Picsart {date_str} {time_str}"
+    except ValueError:
+        return None
+
+def _handle_camscanner(m, filename):
+    """Pattern 13: CamScanner 10-30-2022 17.02.jpg or CamScanner 10-30-2022 17.02_1.jpg"""
+    try:
+        # Format is MM-DD-YYYY HH.MM
+        date_str = f"{m.group('cs_y')}{m.group('cs_mo')}{m.group('cs_d')}" # YYYYMMDD
+        time_str = f"{m.group('cs_h')}{m.group('cs_mi')}00" # HHMMSS (seconds default to 00)
+        return _parse_ymd_hms(date_str, time_str), f"CamScanner {date_str} {time_str}"
+    except ValueError:
+        return None
+
+# Dispatch table mapping _DATE_RE branch names to their handlers. Each
+# handler takes (match, filename) and returns (datetime, info) or None.
+_HANDLERS = {
+    'p1': _handle_p1,
+    'p2a': _handle_p2a,
+    'p2b': _handle_p2b,
+    'ts': _handle_ts,
+    'screenshot': _handle_screenshot,
+    'vid': _handle_vid,
+    'img': _handle_img,
+    'photo': _handle_photo,
+    'jpeg': _handle_jpeg,
+    'vidcap': _handle_vidcap,
+    'tsuuid': _handle_tsuuid,
+    'picsart': _handle_picsart,
+    'camscanner': _handle_camscanner,
+}
+
+@functools.lru_cache(maxsize=65536)
 def extract_date(filename):
     """
     Extract date and time information from a filename.
@@ -54,250 +305,469 @@ def extract_date(filename):
     - And many other common patterns
     
     HOW TO ADD A NEW PATTERN:
-    1. Add a comment describing the pattern
-    2. Create a regex that captures the date/time components
-    3. Use try/except to handle potential parsing errors
-    4. Return a tuple with (datetime_object, explanation_string)
-    
-    Example template for adding a new pattern:
-    ```python
-    # Pattern X: DESCRIPTION_OF_PATTERN (e.g., Camera_YYYYMMDD.jpg)
-    m = re.search(r'YOUR_REGEX_PATTERN_HERE', filename)
-    if m:
-        try:
-            # Extract date components from regex groups
-            # Convert to datetime object
-            dt = datetime.strptime(date_string, 'format_string')
-            return dt, f"explanation string with {captured_values}"
-        except ValueError:
-            pass
-    ```
-    
+    1. Add a named branch to _DATE_RE (or a new compiled pattern at module
+       level if it can't join the alternation, e.g. it needs anchoring)
+    2. Capture the date/time components with named groups
+    3. Write a _handle_<branch> function following the existing examples
+       and register it in _HANDLERS under the branch name
+    4. Use try/except to handle potential parsing errors and return a
+       tuple with (datetime_object, explanation_string), or None on failure
+
     Args:
         filename (str): Filename to analyze
         
     Returns:
         tuple: (datetime object or None, extraction explanation or None)
     """
+    # Too short for any pattern; digit normalization is 1:1 per character,
+    # so the length check can come before it
+    if len(filename) < _MIN_LEN:
+        return None, None
+
     filename = normalize_digits(filename)
-    
-    # Pattern 1: 20181128_110755.jpg or IMG_20180507_192217158.jpg
-    m = re.search(r'(\d{8})_(\d{6})', filename)
-    if m:
-        try:
-            dt = datetime.strptime(m.group(1) + m.group(2), '%Y%m%d%H%M%S')
-            return dt, f"{m.group(1)} {m.group(2)}"
-        except ValueError:
-            pass
-            
-    # Pattern 2A: 2020-01-01 12.30.59.jpg (format with date and time separated) - MOVED UP for precedence
-    m = re.search(r'(\d{4})-(\d{2})-(\d{2}) (\d{2})\.(\d{2})\.(\d{2})', filename)
-    if m:
-        try:
-            date_part = f"{m.group(1)}{m.group(2)}{m.group(3)}"
-            time_part = f"{m.group(4)}{m.group(5)}{m.group(6)}"
-            dt = datetime.strptime(date_part + time_part, '%Y%m%d%H%M%S')
-            return dt, f"{date_part} {time_part}"
-        except ValueError:
-            pass
-            
-    # Pattern 2B: WhatsApp Image 2018-11-27 at 18.41.02.png
-    m = re.search(r'(\d{4})-(\d{2})-(\d{2})', filename)
-    if m:
-        try:
-            date_part = f"{m.group(1)}{m.group(2)}{m.group(3)}"
-            m2 = re.search(r'at (\d{2})\.(\d{2})\.(\d{2})', filename)
-            if m2:
-                time_part = f"{m2.group(1)}{m2.group(2)}{m2.group(3)}"
-            else:
-                time_part = "000000"
-            dt = datetime.strptime(date_part + time_part, '%Y%m%d%H%M%S')
-            return dt, f"{date_part} {time_part}"
-        except ValueError:
-            pass
-
-    # Pattern 3: FB_IMG_1545742864733.jpg or standalone timestamp files like 1531699202381.jpg
-    # Very restrictive - only matches specific prefixes or standalone timestamp files
-    m = re.search(r'(?:FB_IMG_|IMG_)(\d{9,13})(?=\.|_|$)', filename)
-    if not m:
-        # Try standalone timestamp files (entire filename is just digits + extension)
-        m = re.match(r'^(\d{9,13})\.(jpg|jpeg|png|mp4|mov|gif|bmp|tif|tiff|webm|avi|mkv)$', filename, re.IGNORECASE)
-    
-    if m:
-        try:
-            # For 13-digit numbers, assume milliseconds and take first 10 digits
-            # For 9-10 digit numbers, use as-is (seconds)
-            timestamp_str = m.group(1)
-            if len(timestamp_str) == 13:
-                timestamp = int(timestamp_str[:10])
-            else:
-                timestamp = int(timestamp_str)
-            
-            dt = datetime.fromtimestamp(timestamp)
-            
-            # Validate timestamp is reasonable (from 1970 to current date)
-            now = datetime.now()
-            unix_epoch = datetime(1970, 1, 1)  # Beginning of Unix time
-            
-            if unix_epoch <= dt <= now:
-                return dt, f"timestamp {timestamp}"
-        except (ValueError, OverflowError):
-            pass
-
-    # Pattern 4: Screenshot_20200101-151016_Calendar.jpg or Screenshot_20200224-162219.jpg
-    m = re.search(r'Screenshot_(\d{8})-(\d{6})', filename)
-    if m:
-        try:
-            dt = datetime.strptime(m.group(1) + m.group(2), '%Y%m%d%H%M%S')
-            return dt, f"{m.group(1)} {m.group(2)}"
-        except ValueError:
-            pass
 
-    # Pattern 5: VID-20200615-WA0127.mp4
-    m = re.search(r'VID-(\d{8})-WA', filename)
-    if m:
-        try:
-            dt = datetime.strptime(m.group(1), '%Y%m%d')
-            return dt, f"{m.group(1)} 000000"
-        except ValueError:
-            pass
-
-    # Pattern 6: IMG-20181225-WA0014.jpg or IMG-20181218-WA0002.jpeg or IMG-20181128-WA0047.jpg
-    m = re.search(r'IMG-(\d{8})-WA', filename)
-    if m:
-        try:
-            dt = datetime.strptime(m.group(1), '%Y%m%d')
-            return dt, f"{m.group(1)} 000000"
-        except ValueError:
-            pass
-            
-    # Pattern 7: Photo_20200101_123059.jpg (common on Android phones)
-    m = re.search(r'Photo_(\d{8})_(\d{6})', filename)
-    if m:
-        try:
-            dt = datetime.strptime(m.group(1) + m.group(2), '%Y%m%d%H%M%S')
-            return dt, f"{m.group(1)} {m.group(2)}"
-        except ValueError:
-            pass
-            
-    # Pattern 9: JPEG_20200722_183656.jpg (common on smartphones)
-    m = re.search(r'JPEG_(\d{8})_(\d{6})', filename)
-    if m:
-        try:
-            dt = datetime.strptime(m.group(1) + m.group(2), '%Y%m%d%H%M%S')
-            return dt, f"{m.group(1)} {m.group(2)}"
-        except ValueError:
-            pass
-            
-    # Pattern 10: VideoCapture_20240513-155722.jpg
-    m = re.search(r'VideoCapture_(\d{8})-(\d{6})', filename)
-    if m:
-        try:
-            dt = datetime.strptime(m.group(1) + m.group(2), '%Y%m%d%H%M%S')
-            return dt, f"VideoCapture {m.group(1)} {m.group(2)}"
-        except ValueError:
-            pass
+    # Reject filenames that can't possibly match any pattern with one cheap scan
+    if not _PREFILTER_RE.search(filename):
+        return None, None
 
-    # Pattern 11: 1628085150288-52bceeb9-f9d1-45ec-bcef-c8e594921.jpg (Timestamp-UUID.jpg)
-    m = re.search(r'^(\d{13})-[\w-]+\.(jpg|jpeg|png|mp4|mov|gif|bmp|tif|tiff|webm|avi|mkv)$', filename, re.IGNORECASE)
-    if m:
-        try:
-            timestamp_str = m.group(1)
-            timestamp = int(timestamp_str[:10]) # Assume milliseconds, take first 10 digits for seconds
-            dt = datetime.fromtimestamp(timestamp)
-            # Validate timestamp is reasonable (from 1970 to current date)
-            now = datetime.now()
-            unix_epoch = datetime(1970, 1, 1)
-            if unix_epoch <= dt <= now:
-                return dt, f"timestamp {timestamp}"
-        except (ValueError, OverflowError):
-            pass
+    # Collect the leftmost match of each branch present; branches are then
+    # tried in declaration order (the original pattern priority), falling
+    # through to the next branch when a handler rejects its match. Each
+    # scan restarts just past the previous match's START, not its end: a
+    # branch can consume a span that hides another branch starting inside
+    # it (e.g. a prefixed timestamp swallowing the digits of a
+    # YYYYMMDD_HHMMSS stamp), and the hidden branch may outrank it.
+    found = {}
+    pos = 0
+    while True:
+        m = _DATE_RE.search(filename, pos)
+        if m is None:
+            break
+        branch = m.lastgroup
+        if branch not in found:
+            found[branch] = m
+        # 2B is a prefix of 2A, so the alternation shadows it wherever 2A
+        # matches; record the 2A match as the 2B candidate too, in case
+        # the 2A handler rejects its time part
+        if branch == 'p2a' and 'p2b' not in found:
+            found['p2b'] = m
+        pos = m.start() + 1
+    if found:
+        for branch, handler in _HANDLERS.items():
+            m = found.get(branch)
+            if m:
+                result = handler(m, filename)
+                if result:
+                    return result
 
-    # Pattern 12: Picsart_22-09-05_08-32-31-010.jpg
-    m = re.search(r'Picsart_(\d{2})-(\d{2})-(\d{2})_(\d{2})-(\d{2})-(\d{2})', filename)
-    if m:
-        try:
-            # Assuming YY is 20YY
-            date_str = f"20{m.group(1)}{m.group(2)}{m.group(3)}"
-            time_str = f"{m.group(4)}{m.group(5)}{m.group(6)}"
-            dt = datetime.strptime(date_str + time_str, '%Y%m%d%H%M%S')
-            return dt, f"Picsart {date_str} {time_str}"
-        except ValueError:
-            pass
+    # Pattern 3 (standalone): entire filename is just a timestamp + extension.
+    # str.isdigit + a length check replace a regex match here; splitext
+    # splits at the last dot, so any other dot or non-digit in the stem
+    # fails the isdigit test just as it failed the old anchored pattern.
+    if filename[:1].isdigit():
+        stem, ext = os.path.splitext(filename)
+        if 9 <= len(stem) <= 13 and stem.isdigit() and ext.lower() in _STANDALONE_TS_EXTS:
+            dt, info = _timestamp_to_date(stem)
+            if dt:
+                return dt, info
 
-    # Pattern 13: CamScanner 10-30-2022 17.02.jpg or CamScanner 10-30-2022 17.02_1.jpg
-    m = re.search(r'CamScanner (\d{2})-(\d{2})-(\d{4}) (\d{2})\.(\d{2})(?:_\d+)?\.(jpg|jpeg|png|pdf)$', filename, re.IGNORECASE)
-    if m:
-        try:
-            # Format is MM-DD-YYYY HH.MM
-            date_str = f"{m.group(3)}{m.group(1)}{m.group(2)}" # YYYYMMDD
-            time_str = f"{m.group(4)}{m.group(5)}00" # HHMMSS (seconds default to 00)
-            dt = datetime.strptime(date_str + time_str, '%Y%m%d%H%M%S')
-            return dt, f"CamScanner {date_str} {time_str}"
-        except ValueError:
-            pass
-            
     return None, None
 
-def process_folder_recursively(root_path, dry_run=False, verbose=False, extensions=None):
+@functools.lru_cache(maxsize=4096)
+def _fromtimestamp_cached(timestamp):
+    """
+    datetime.fromtimestamp with memoization.
+
+    The conversion goes through localtime(3), which applies timezone and
+    DST rules on every call; the same timestamp often appears under
+    several names (FB_IMG_ prefix, bare file, millisecond variant), so
+    repeats are served from the cache. Caching per exact timestamp keeps
+    DST transitions correct, which day-bucket arithmetic would not.
+    """
+    return datetime.fromtimestamp(timestamp)
+
+def _now():
+    """Return the frozen "now" snapshot, or the live clock when unfrozen."""
+    return _NOW if _NOW is not None else datetime.now()
+
+def freeze_now(dt=None):
+    """
+    Pin the "now" used to validate timestamps, for the duration of a batch
+    (or a test). With no argument, snapshots the current clock. Clears the
+    extract_date memo cache so results validated against an earlier
+    snapshot can't leak across the freeze boundary.
+
+    Args:
+        dt (datetime): The instant to treat as "now" (default: datetime.now())
+    """
+    global _NOW, _NOW_TS
+    _NOW = dt if dt is not None else datetime.now()
+    _NOW_TS = _NOW.timestamp()
+    extract_date.cache_clear()
+
+def unfreeze_now():
+    """Undo freeze_now, returning timestamp validation to the live clock."""
+    global _NOW, _NOW_TS
+    _NOW = None
+    _NOW_TS = None
+    extract_date.cache_clear()
+
+def _timestamp_to_date(timestamp_str):
+    """
+    Convert a 9-13 digit Unix timestamp string to a datetime, validating
+    that it falls between the Unix epoch and the current date.
+
+    For 13-digit numbers, assumes milliseconds and takes the first 10 digits;
+    9-10 digit numbers are used as-is (seconds).
+
+    Args:
+        timestamp_str (str): Digit string captured from the filename
+
+    Returns:
+        tuple: (datetime object or None, extraction explanation or None)
+    """
+    try:
+        if len(timestamp_str) == 13:
+            timestamp = int(timestamp_str[:10])
+        else:
+            timestamp = int(timestamp_str)
+
+        # Cheap integer pre-check before building a datetime: values far
+        # outside [epoch, now] (huge social-media IDs, future dates) are
+        # the common case on the reject path. One day of slack on each
+        # side covers timezone offsets; the exact datetime comparison
+        # below stays authoritative.
+        now_ts = _NOW_TS if _NOW_TS is not None else time.time()
+        if not -86400 <= timestamp <= now_ts + 86400:
+            return None, None
+
+        dt = _fromtimestamp_cached(timestamp)
+
+        # Validate timestamp is reasonable (from 1970 to current date)
+        if _UNIX_EPOCH <= dt <= _now():
+            return dt, f"timestamp {timestamp}"
+    except (ValueError, OverflowError):
+        pass
+    return None, None
+
+def extract_dates_batch(names):
+    """
+    Extract dates for a whole batch of filenames in one call.
+
+    This is the bulk entry point used by the per-directory processing
+    loop: it amortizes the per-call overhead into one tight loop and
+    shields the caller from unexpected extraction errors (which are
+    logged and reported as unrecognized).
+
+    Joining the batch into a single buffer and matching it in one pass
+    was considered and rejected: the timestamp-UUID and CamScanner
+    branches are anchored to the start/end of the filename, and the
+    standalone-timestamp check works on the whole name, so per-name
+    matching is required for correctness.
+
+    Args:
+        names (iterable): Filenames to analyze, in order
+
+    Returns:
+        list: One (datetime or None, info or None) tuple per input name
+    """
+    results = []
+    append = results.append
+    for name in names:
+        try:
+            append(extract_date(name))
+        except Exception as e:
+            logging.error(f"Error processing {name}: {str(e)}")
+            append((None, None))
+    return results
+
+def _extract_chunk(names):
+    """Worker for extract_dates_parallel: handle one slice of names."""
+    return extract_dates_batch(names)
+
+def extract_dates_parallel(names, workers=None):
+    """
+    Extract dates for a large batch of filenames across worker processes.
+
+    Extraction is pure CPU (regex + datetime construction), so sharding
+    the list over processes sidesteps the GIL and scales with cores.
+    Each worker compiles the patterns once and keeps its own memo cache.
+    Small batches fall back to extract_dates_batch, since forking the
+    pool costs more than it saves.
+
+    The command-line tool does not use this: its bottleneck is the
+    stat/utime syscalls, which the --jobs thread pool already overlaps.
+    This entry point is for library callers holding a large list of
+    names with no I/O attached.
+
+    Args:
+        names (iterable): Filenames to analyze, in order
+        workers (int): Number of worker processes (default: cpu count)
+
+    Returns:
+        list: One (datetime or None, info or None) tuple per input name
+    """
+    names = list(names)
+    if len(names) < 2048:
+        return extract_dates_batch(names)
+
+    workers = workers or os.cpu_count() or 1
+    chunk_size = -(-len(names) // workers)
+    chunks = [names[i:i + chunk_size] for i in range(0, len(names), chunk_size)]
+
+    results = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for part in executor.map(_extract_chunk, chunks):
+            results.extend(part)
+    return results
+
+# The dir_fd fast path (resolving utime/access against an open directory
+# descriptor) is POSIX-only: os.O_DIRECTORY does not exist on Windows and
+# the dir_fd keyword raises NotImplementedError where unsupported. When
+# False, _walk_dirs yields dir_fd=None and the full-path fallbacks run.
+_USE_DIR_FD = (
+    hasattr(os, 'O_DIRECTORY')
+    and os.utime in os.supports_dir_fd
+    and os.access in os.supports_dir_fd
+)
+
+def _walk_dirs(root_path):
+    """
+    Recursively yield (dir_fd, file_entries) pairs, one per directory.
+
+    Uses os.scandir directly instead of os.walk + os.path.isfile so the
+    file-type information cached from the directory listing is reused,
+    avoiding one extra stat call per file.
+
+    dir_fd is an open descriptor for the directory; passing it to os.utime
+    with just the entry name makes the kernel resolve one path component
+    instead of walking the full path from the root. The descriptor is
+    closed when the generator advances past the directory, so it must be
+    used before requesting the next one.
+
+    Args:
+        root_path (str): Root path to start the search
+
+    Yields:
+        tuple: (int or None, list[os.DirEntry]) - the open fd of a
+        directory (None if the open failed or the platform lacks dir_fd
+        support) and its regular files
+    """
+    dir_fd = None
+    try:
+        if _USE_DIR_FD:
+            try:
+                dir_fd = os.open(root_path, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                dir_fd = None
+
+        files = []
+        subdirs = []
+        with os.scandir(root_path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append(entry)
+                except OSError as e:
+                    logging.error(f"Error accessing {entry.path}: {str(e)}")
+
+        if files:
+            yield dir_fd, files
+        for subdir in subdirs:
+            yield from _walk_dirs(subdir)
+    except OSError as e:
+        logging.error(f"Error walking directory {root_path}: {str(e)}")
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+def _process_file(fname, fpath, dry_run=False, verbose=False, dir_fd=None):
+    """
+    Extract a date from a single filename and restore the file's dates.
+
+    Args:
+        fname (str): Base name of the file (used for pattern matching)
+        fpath (str): Full path of the file (used for logging, and for
+            os.utime when no dir_fd is given)
+        dry_run (bool): If True, simulates changes without actually making them
+        verbose (bool): If True, displays detailed information about the file
+        dir_fd (int): Optional open fd of the file's directory; when given,
+            os.utime resolves only the entry name relative to it
+
+    Returns:
+        bool or None: True if a date was restored (or simulated), False if
+        no pattern was recognized, None if an unexpected error occurred
+    """
+    try:
+        dt, info = extract_date(fname)
+        if dt:
+            ts = dt.timestamp()
+            info_enabled = _log.isEnabledFor(logging.INFO)
+
+            if dry_run:
+                if info_enabled:
+                    logging.info(f"[SIMULATION] {fpath} => {dt} ({info})")
+            else:
+                try:
+                    if dir_fd is not None:
+                        os.utime(fname, (ts, ts), dir_fd=dir_fd)
+                    else:
+                        os.utime(fpath, (ts, ts))
+                    if info_enabled:
+                        logging.info(f"{fpath} => {dt} ({info})")
+                except (PermissionError, OSError) as e:
+                    logging.error(f"Error changing date of {fpath}: {str(e)}")
+            return True
+
+        if verbose and _log.isEnabledFor(logging.DEBUG):
+            logging.debug(f"{fpath} => pattern not recognized, date unchanged")
+        return False
+    except Exception as e:
+        logging.error(f"Error processing {fpath}: {str(e)}")
+        return None
+
+def process_folder_recursively(root_path, dry_run=False, verbose=False, extensions=None, jobs=1):
     """
     Recursively process all files in a folder, adjusting their dates
     based on patterns found in their names.
-    
+
     Args:
         root_path (str): Root path to start the search
         dry_run (bool): If True, simulates changes without actually making them
         verbose (bool): If True, displays detailed information about each file
         extensions (list): List of file extensions to process (e.g., ['.jpg', '.mp4'])
-    
+        jobs (int): Number of worker threads; with more than one, the
+            per-file stat/utime syscalls overlap, which helps on slow disks
+            and network filesystems
+
     Returns:
         tuple: (int, int, list) - Total files processed, total files modified, and list of unrecognized files
     """
     total_files = 0
     modified_files = 0
     unrecognized_files = []
-    
-    logging.info(f"Starting file processing in: {root_path}")
-    
+
+    # Snapshot "now" once for the whole batch (timestamp validation);
+    # freeze_now also drops memoized extract_date results that were
+    # validated against a previous snapshot
+    freeze_now()
     try:
-        for dirpath, dirnames, filenames in os.walk(root_path):
-            for fname in filenames:
-                fpath = os.path.join(dirpath, fname)
-                
+
+        # Check effective log levels once so hot loops skip f-string formatting
+        # entirely when the message would be discarded
+        info_enabled = _log.isEnabledFor(logging.INFO)
+        debug_enabled = _log.isEnabledFor(logging.DEBUG)
+
+        # Normalize the extension filter once into a set of lowercase suffixes
+        ext_set = None
+        if extensions:
+            ext_set = {e.lower() if e.startswith('.') else '.' + e.lower() for e in extensions}
+
+        logging.info(f"Starting file processing in: {root_path}")
+
+        def filtered(entries):
+            """Yield the entries that pass the extension filter"""
+            splitext = os.path.splitext
+            for entry in entries:
                 # Skip files that don't match specified extensions (if extensions are provided)
-                if extensions and not any(fname.lower().endswith(ext.lower()) for ext in extensions):
-                    if verbose:
-                        logging.debug(f"Skipping {fpath} (extension doesn't match)")
-                    continue
-                
-                total_files += 1
-                    
-                if not os.path.isfile(fpath):
+                if ext_set and splitext(entry.name)[1].lower() not in ext_set:
+                    if verbose and debug_enabled:
+                        logging.debug(f"Skipping {entry.path} (extension doesn't match)")
                     continue
+                yield entry
 
-                try:
-                    dt, info = extract_date(fname)
-                    if dt:
+        if jobs and jobs > 1:
+            # Workers may run after the walk has moved past (and closed) a
+            # directory fd, so the parallel path sticks to full-path utime
+            with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = {}
+                for _, entries in _walk_dirs(root_path):
+                    for entry in filtered(entries):
+                        total_files += 1
+                        future = executor.submit(_process_file, entry.name, entry.path, dry_run, verbose)
+                        futures[future] = entry.path
+
+                for future in concurrent.futures.as_completed(futures):
+                    status = future.result()
+                    if status:
                         modified_files += 1
-                        ts = time.mktime(dt.timetuple())
-                        
-                        if dry_run:
-                            logging.info(f"[SIMULATION] {fpath} => {dt} ({info})")
-                        else:
-                            try:
-                                os.utime(fpath, (ts, ts))
-                                logging.info(f"{fpath} => {dt} ({info})")
-                            except (PermissionError, OSError) as e:
-                                logging.error(f"Error changing date of {fpath}: {str(e)}")
+                    elif status is False:
+                        unrecognized_files.append(futures[future])
+        else:
+            for dir_fd, entries in _walk_dirs(root_path):
+                # Phase 1: CPU-bound extraction into parallel arrays (SoA),
+                # keeping regex work away from the syscall loop below
+                names = []
+                paths = []
+                results = []
+                stamps = array.array('d')
+
+                batch = list(filtered(entries))
+                total_files += len(batch)
+
+                for entry, (dt, info) in zip(batch, extract_dates_batch(e.name for e in batch)):
+                    if dt:
+                        names.append(entry.name)
+                        paths.append(entry.path)
+                        results.append((dt, info))
+                        stamps.append(dt.timestamp())
                     else:
-                        unrecognized_files.append(fpath)
-                        if verbose:
-                            logging.debug(f"{fpath} => pattern not recognized, date unchanged")
-                except Exception as e:
-                    logging.error(f"Error processing {fpath}: {str(e)}")
-    except Exception as e:
-        logging.error(f"Error walking directory {root_path}: {str(e)}")
-        
+                        unrecognized_files.append(entry.path)
+                        if verbose and debug_enabled:
+                            logging.debug(f"{entry.path} => pattern not recognized, date unchanged")
+
+                modified_files += len(names)
+
+                # Phase 2: apply the collected timestamps in a tight syscall loop
+                if dry_run:
+                    if info_enabled:
+                        for i, ts in enumerate(stamps):
+                            dt, info = results[i]
+                            logging.info(f"[SIMULATION] {paths[i]} => {dt} ({info})")
+                    continue
+
+                # One writability probe per directory: when it is writable the
+                # loop runs without per-file exception setup, and any unexpected
+                # failure degrades to the guarded loop for the remaining files
+                if dir_fd is not None:
+                    writable = os.access('.', os.W_OK, dir_fd=dir_fd)
+                else:
+                    writable = bool(stamps) and os.access(os.path.dirname(paths[0]), os.W_OK)
+
+                utime = os.utime
+                start = 0
+                if writable:
+                    try:
+                        for i, ts in enumerate(stamps):
+                            dt, info = results[i]
+                            if dir_fd is not None:
+                                utime(names[i], (ts, ts), dir_fd=dir_fd)
+                            else:
+                                utime(paths[i], (ts, ts))
+                            if info_enabled:
+                                logging.info(f"{paths[i]} => {dt} ({info})")
+                            start = i + 1
+                    except (PermissionError, OSError) as e:
+                        logging.error(f"Error changing date of {paths[start]}: {str(e)}")
+                        start += 1
+
+                for i in range(start, len(stamps)):
+                    ts = stamps[i]
+                    dt, info = results[i]
+                    try:
+                        if dir_fd is not None:
+                            utime(names[i], (ts, ts), dir_fd=dir_fd)
+                        else:
+                            utime(paths[i], (ts, ts))
+                        if info_enabled:
+                            logging.info(f"{paths[i]} => {dt} ({info})")
+                    except (PermissionError, OSError) as e:
+                        logging.error(f"Error changing date of {paths[i]}: {str(e)}")
+
+    finally:
+        unfreeze_now()
     return total_files, modified_files, unrecognized_files
 
 def configure_logger(log_level=logging.INFO):
@@ -333,6 +803,8 @@ def parse_arguments():
                         help='Show detailed information during processing')
     parser.add_argument('-e', '--ext', nargs='+', metavar='EXTENSION',
                         help='Only process files with these extensions (ex: jpg png mp4)')
+    parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                        help='Number of worker threads (default: 1, useful on slow disks)')
     parser.add_argument('--log', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
                         default='INFO', help='Set logging detail level')
     parser.add_argument('--ignore-text', action='store_true',
@@ -377,10 +849,11 @@ if __name__ == "__main__":
     try:
         start_time = time.time()
         total, modified, unrecognized = process_folder_recursively(
-            folder, 
+            folder,
             dry_run=args.dry_run,
             verbose=args.verbose,
-            extensions=extensions
+            extensions=extensions,
+            jobs=args.jobs
         )
         duration = time.time() - start_time
         
@@ -7,97 +7,81 @@ Este arquivo contém testes abrangentes para verificar se o script está
 funcionando corretamente com diferentes padrões de nomes de arquivo.
 """
 
-import os
-import sys
-import tempfile
-import shutil
 import unittest
 from datetime import datetime
 from date_restorer import extract_date
 
 class TestDateRestorer(unittest.TestCase):
     
-    def setUp(self):
-        """Configura o ambiente de teste"""
-        self.test_dir = tempfile.mkdtemp()
-        self.addCleanup(shutil.rmtree, self.test_dir)
-    
-    def test_pattern_1_digital_camera(self):
-        """Testa Pattern 1: Câmeras digitais com formato YYYYMMDD_HHMMSS"""
-        test_cases = [
-            ("20181128_110755.jpg", datetime(2018, 11, 28, 11, 7, 55)),
-            ("IMG_20180507_192217158.jpg", datetime(2018, 5, 7, 19, 22, 17)),
-            ("20200101_000000.png", datetime(2020, 1, 1, 0, 0, 0)),
-        ]
-        
-        for filename, expected_date in test_cases:
-            with self.subTest(filename=filename):
-                dt, info = extract_date(filename)
-                self.assertIsNotNone(dt, f"Deveria reconhecer {filename}")
-                self.assertEqual(dt, expected_date, f"Data incorreta para {filename}")
-    
-    def test_pattern_2_whatsapp(self):
-        """Testa Pattern 2: WhatsApp com formato YYYY-MM-DD"""
-        test_cases = [
-            ("WhatsApp Image 2018-11-27 at 18.41.02.png", datetime(2018, 11, 27, 18, 41, 2)),
-            ("WhatsApp Video 2020-05-15.mp4", datetime(2020, 5, 15, 0, 0, 0)),
-            ("Document 2019-12-31.pdf", datetime(2019, 12, 31, 0, 0, 0)),
-        ]
-        
-        for filename, expected_date in test_cases:
-            with self.subTest(filename=filename):
-                dt, info = extract_date(filename)
-                self.assertIsNotNone(dt, f"Deveria reconhecer {filename}")
-                self.assertEqual(dt, expected_date, f"Data incorreta para {filename}")
-    
-    def test_pattern_3_timestamps_validos(self):
-        """Testa Pattern 3: Timestamps válidos"""
-        test_cases = [
-            # Timestamps com prefixos conhecidos
-            ("FB_IMG_1545742864733.jpg", 1545742864),  # 2018-12-25
-            ("IMG_1531699202.jpg", 1531699202),        # 2018-07-16
-            
-            # Timestamps standalone
-            ("1577836800.jpg", 1577836800),            # 2020-01-01
-            ("946684800.jpg", 946684800),              # 2000-01-01 (Y2K)
-            # Note: 0.jpg removed because 0 has only 1 digit, below minimum of 9
-        ]
-        
-        for filename, expected_timestamp in test_cases:
-            with self.subTest(filename=filename):
-                dt, info = extract_date(filename)
-                self.assertIsNotNone(dt, f"Deveria reconhecer {filename}")
-                expected_dt = datetime.fromtimestamp(expected_timestamp)
-                self.assertEqual(dt, expected_dt, f"Data incorreta para {filename}")
-    
-    def test_pattern_3_timestamps_invalidos(self):
-        """Testa Pattern 3: Timestamps que devem ser rejeitados"""
-        test_cases = [
-            # Números grandes que não são timestamps
-            "130904361_220496336181674_1278815373953210947_n.jpg",
-            "12345678901234567890_invalid.jpg",
-            "999999999999999999999_super_long.jpg",
-            "random_123456789012345_numbers.jpg",
-        ]
-        
-        for filename in test_cases:
-            with self.subTest(filename=filename):
-                dt, info = extract_date(filename)
-                self.assertIsNone(dt, f"Não deveria reconhecer {filename}")
-                
-    def test_pattern_10_videocapture(self):
-        """Testa Pattern 10: VideoCapture_YYYYMMDD-HHMMSS"""
-        test_cases = [
-            ("VideoCapture_20240513-155722.jpg", datetime(2024, 5, 13, 15, 57, 22)),
-            ("VideoCapture_20230101-010101.jpg", datetime(2023, 1, 1, 1, 1, 1)),
-        ]
-        
-        for filename, expected_date in test_cases:
+
+    # Tabela de casos: (nome do arquivo, datetime esperado ou None quando o
+    # arquivo não deve ser reconhecido). Um único método percorre a tabela
+    # com subTest, então o framework contabiliza um teste só para todos os casos.
+    _CASES = [
+        # Pattern 1: Câmeras digitais com formato YYYYMMDD_HHMMSS
+        ("20181128_110755.jpg", datetime(2018, 11, 28, 11, 7, 55)),
+        ("IMG_20180507_192217158.jpg", datetime(2018, 5, 7, 19, 22, 17)),
+        ("20200101_000000.png", datetime(2020, 1, 1, 0, 0, 0)),
+        # Pattern 2: WhatsApp com formato YYYY-MM-DD
+        ("WhatsApp Image 2018-11-27 at 18.41.02.png", datetime(2018, 11, 27, 18, 41, 2)),
+        ("WhatsApp Video 2020-05-15.mp4", datetime(2020, 5, 15, 0, 0, 0)),
+        ("Document 2019-12-31.pdf", datetime(2019, 12, 31, 0, 0, 0)),
+        # Pattern 3: Timestamps válidos (com prefixo e standalone)
+        ("FB_IMG_1545742864733.jpg", datetime.fromtimestamp(1545742864)),  # 2018-12-25
+        ("IMG_1531699202.jpg", datetime.fromtimestamp(1531699202)),        # 2018-07-16
+        ("1577836800.jpg", datetime.fromtimestamp(1577836800)),            # 2020-01-01
+        ("946684800.jpg", datetime.fromtimestamp(946684800)),              # 2000-01-01 (Y2K)
+        # Note: 0.jpg removed because 0 has only 1 digit, below minimum of 9
+        # Pattern 3: Timestamps que devem ser rejeitados
+        ("130904361_220496336181674_1278815373953210947_n.jpg", None),
+        ("12345678901234567890_invalid.jpg", None),
+        ("999999999999999999999_super_long.jpg", None),
+        ("random_123456789012345_numbers.jpg", None),
+        # Pattern 10: VideoCapture_YYYYMMDD-HHMMSS
+        ("VideoCapture_20240513-155722.jpg", datetime(2024, 5, 13, 15, 57, 22)),
+        ("VideoCapture_20230101-010101.jpg", datetime(2023, 1, 1, 1, 1, 1)),
+        # Pattern 12: Picsart_YY-MM-DD_HH-MM-SS
+        ("Picsart_22-09-05_08-32-31-010.jpg", datetime(2022, 9, 5, 8, 32, 31)),
+        ("Picsart_21-01-15_12-30-45-123.jpg", datetime(2021, 1, 15, 12, 30, 45)),
+        # Pattern 13: CamScanner MM-DD-YYYY HH.MM
+        ("CamScanner 10-30-2022 17.02.jpg", datetime(2022, 10, 30, 17, 2, 0)),
+        ("CamScanner 10-30-2022 17.02_1.jpg", datetime(2022, 10, 30, 17, 2, 0)),
+        ("CamScanner 01-15-2020 08.45.pdf", datetime(2020, 1, 15, 8, 45, 0)),
+        ("camscanner 10-30-2022 17.02.jpg", datetime(2022, 10, 30, 17, 2, 0)),  # prefixo é case-insensitive
+        # Precedência: Pattern 1 vence mesmo aparecendo depois no nome, e
+        # uma hora impossível cai para a data pura (comportamento original)
+        ("2020-05-15 20181128_110755.jpg", datetime(2018, 11, 28, 11, 7, 55)),
+        ("2020-01-01 25.30.59.jpg", datetime(2020, 1, 1, 0, 0, 0)),
+        # Sobreposição: um ramo não pode esconder outro de maior prioridade
+        # que começa dentro do trecho consumido
+        ("IMG_1420181128_110755.jpg", datetime(2018, 11, 28, 11, 7, 55)),
+        ("IMG_9999920181128_110755.jpg", datetime(2018, 11, 28, 11, 7, 55)),
+        ("1628085150288-2021-01-01-abc.jpg", datetime(2021, 1, 1, 0, 0, 0)),
+        # Prioridade entre padrões de app: Pattern 6 vence o 10, e o 4 vence
+        # o 10, independentemente da posição no nome
+        ("IMG-20181225-WA0014 VideoCapture_20240513-155722.jpg", datetime(2018, 12, 25, 0, 0, 0)),
+        ("VideoCapture_20240513-155722 Screenshot_20200101-151016.jpg", datetime(2020, 1, 1, 15, 10, 16)),
+        # O Pattern 7 resgata o nome quando o primeiro carimbo solto é inválido
+        ("99999999_999999 Photo_20200101_123059.jpg", datetime(2020, 1, 1, 12, 30, 59)),
+        # Arquivos que não devem ser reconhecidos
+        ("arquivo_qualquer.jpg", None),
+        ("foto_sem_data.png", None),
+        ("video.mp4", None),
+        ("documento.pdf", None),
+        ("nome_estranho_123.jpg", None),
+    ]
+
+    def test_all_patterns(self):
+        """Testa todos os padrões de data/hora em uma única tabela de casos"""
+        for filename, expected_date in self._CASES:
             with self.subTest(filename=filename):
                 dt, info = extract_date(filename)
-                self.assertIsNotNone(dt, f"Deveria reconhecer {filename}")
-                self.assertEqual(dt, expected_date, f"Data incorreta para {filename}")
-                
+                if expected_date is None:
+                    self.assertIsNone(dt, f"Não deveria reconhecer {filename}")
+                else:
+                    self.assertIsNotNone(dt, f"Deveria reconhecer {filename}")
+                    self.assertEqual(dt, expected_date, f"Data incorreta para {filename}")
+
     def test_pattern_11_timestamp_uuid(self):
         """Testa Pattern 11: TIMESTAMP-UUID.jpg"""
         # O timestamp 1628085150 corresponde a 2021-08-04 com hora variável dependendo do fuso horário
@@ -119,48 +103,6 @@ class TestDateRestorer(unittest.TestCase):
                 # Verificamos também se o texto de informação contém "timestamp"
                 self.assertIn("timestamp", info, f"Informação deve conter 'timestamp' para {filename}")
                 
-    def test_pattern_12_picsart(self):
-        """Testa Pattern 12: Picsart_YY-MM-DD_HH-MM-SS"""
-        test_cases = [
-            ("Picsart_22-09-05_08-32-31-010.jpg", datetime(2022, 9, 5, 8, 32, 31)),
-            ("Picsart_21-01-15_12-30-45-123.jpg", datetime(2021, 1, 15, 12, 30, 45)),
-        ]
-        
-        for filename, expected_date in test_cases:
-            with self.subTest(filename=filename):
-                dt, info = extract_date(filename)
-                self.assertIsNotNone(dt, f"Deveria reconhecer {filename}")
-                self.assertEqual(dt, expected_date, f"Data incorreta para {filename}")
-                
-    def test_pattern_13_camscanner(self):
-        """Testa Pattern 13: CamScanner MM-DD-YYYY HH.MM"""
-        test_cases = [
-            ("CamScanner 10-30-2022 17.02.jpg", datetime(2022, 10, 30, 17, 2, 0)),
-            ("CamScanner 10-30-2022 17.02_1.jpg", datetime(2022, 10, 30, 17, 2, 0)),
-            ("CamScanner 01-15-2020 08.45.pdf", datetime(2020, 1, 15, 8, 45, 0)),
-        ]
-        
-        for filename, expected_date in test_cases:
-            with self.subTest(filename=filename):
-                dt, info = extract_date(filename)
-                self.assertIsNotNone(dt, f"Deveria reconhecer {filename}")
-                self.assertEqual(dt, expected_date, f"Data incorreta para {filename}")
-    
-    def test_arquivos_nao_reconhecidos(self):
-        """Testa arquivos que não devem ser reconhecidos"""
-        test_cases = [
-            "arquivo_qualquer.jpg",
-            "foto_sem_data.png",
-            "video.mp4",
-            "documento.pdf",
-            "nome_estranho_123.jpg",
-        ]
-        
-        for filename in test_cases:
-            with self.subTest(filename=filename):
-                dt, info = extract_date(filename)
-                self.assertIsNone(dt, f"NÃO deveria reconhecer {filename}")
-    
     def test_normalize_digits(self):
         """Testa a normalização de dígitos unicode"""
         from date_restorer import normalize_digits
@@ -235,17 +177,13 @@ def run_manual_tests():
 
 
 if __name__ == "__main__":
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Testes para o Date Restorer")
-    parser.add_argument("--manual", action="store_true", help="Executa testes manuais")
-    parser.add_argument("--unittest", action="store_true", help="Executa testes unitários")
-    
-    args = parser.parse_args()
-    
-    if args.manual:
+    import sys
+
+    flag = sys.argv[1] if len(sys.argv) > 1 else ""
+
+    if flag == "--manual":
         run_manual_tests()
-    elif args.unittest:
+    elif flag == "--unittest":
         unittest.main(argv=[''], exit=False, verbosity=2)
     else:
         # Se nenhuma opção específica for escolhida, executa ambos